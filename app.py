@@ -1,11 +1,19 @@
 import os
-from flask import Flask, render_template, jsonify, request, redirect, url_for, flash, send_from_directory
+import io
+import re
+import csv
+import tempfile
+import click
+from flask import Flask, render_template, jsonify, request, redirect, url_for, flash, send_from_directory, send_file
 from flask_sqlalchemy import SQLAlchemy
 from flask_login import LoginManager, UserMixin, login_user, logout_user, login_required, current_user
 from werkzeug.security import generate_password_hash, check_password_hash
 from dotenv import load_dotenv
-from datetime import datetime, timezone
+from datetime import date, datetime, time, timedelta, timezone
 import uuid
+import psycopg2
+from sqlalchemy import text
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.dialects.postgresql import ARRAY, UUID
 import json
 from firebase_admin import credentials, messaging, initialize_app
@@ -61,6 +69,7 @@ class Task(db.Model):
     target_date = db.Column(db.Date)
     note = db.Column(db.Text)
     status = db.Column(db.Text, default="not started")
+    completed_at = db.Column(db.DateTime(timezone=True))
 
 
 class Goal(db.Model):
@@ -81,6 +90,7 @@ class Reminder(db.Model):
     remind_date = db.Column(db.Date)
     repeat_frequency = db.Column(db.Text)
     sent = db.Column(db.Boolean, default=False)
+    sent_at = db.Column(db.DateTime(timezone=True))
 
 class FCMToken(db.Model):
     __tablename__ = "fcm_tokens"
@@ -201,6 +211,10 @@ def dashboard():
 
 # ============== TASKS ==============
 
+def is_completed(status):
+    return (status or "").upper() == "COMPLETED"
+
+
 @app.route("/getTasks")
 @login_required
 def get_tasks():
@@ -226,6 +240,8 @@ def add_task():
         target_date=datetime.strptime(data["date"], "%Y-%m-%d").date() if data.get("date") else None,
         status=data.get("status", "not started")
     )
+    if is_completed(new.status):
+        new.completed_at = datetime.now(timezone.utc)
     db.session.add(new)
     db.session.commit()
     return jsonify({"success": True}), 201
@@ -244,6 +260,10 @@ def update_task(task_id):
         task.task = data["text"]
     if "status" in data:
         task.status = data["status"]
+        if not is_completed(task.status):
+            task.completed_at = None
+        elif task.completed_at is None:
+            task.completed_at = datetime.now(timezone.utc)
     if "tags" in data:
         task.tags = data["tags"] if isinstance(data["tags"], list) else [data["tags"]]
     if "date" in data:
@@ -643,6 +663,7 @@ def check_and_send_reminders():
                     )
 
                     reminder.sent = True
+                    reminder.sent_at = datetime.now(timezone.utc)
                     db.session.commit()
 
                     if response:
@@ -663,6 +684,753 @@ def convert_to_12h(time_24):
     return f"{hour}:{minute} {ampm}"
 
 
+# ============================================================================
+# ARCHIVE (completed tasks & sent reminders)
+# ============================================================================
+# Completed tasks and sent reminders older than ARCHIVE_AFTER_DAYS are moved
+# out of the hot tables into archive tables range-partitioned by the month they
+# were archived in, so the per-user lists and the reminder scan only touch live
+# rows. Recurring reminders stay live; they fire again after being sent.
+
+ARCHIVE_AFTER_DAYS = int(os.getenv("ARCHIVE_AFTER_DAYS", "30"))
+ARCHIVE_BATCH_SIZE = int(os.getenv("ARCHIVE_BATCH_SIZE", "1000"))
+ARCHIVE_READ_DAYS = 90
+ARCHIVE_READ_LIMIT = 100
+ARCHIVE_READ_MAX_LIMIT = 500
+
+# table -> (primary key, eligibility filter, timestamp column, backfill value)
+ARCHIVE_SPECS = {
+    "tasks": (
+        "task_id",
+        "UPPER(status) = 'COMPLETED'",
+        "completed_at",
+        "CURRENT_TIMESTAMP",
+    ),
+    "reminders": (
+        "reminder_id",
+        "sent AND COALESCE(repeat_frequency, 'NONE') = 'NONE'",
+        "sent_at",
+        "COALESCE(remind_date::timestamptz, CURRENT_TIMESTAMP)",
+    ),
+}
+
+_archive_partitions = set()
+
+
+def table_columns(table):
+    """Column names of the real table, including ones the models don't map"""
+    return db.session.execute(text(
+        "SELECT column_name FROM information_schema.columns "
+        "WHERE table_schema = current_schema() AND table_name = :table "
+        "ORDER BY ordinal_position"
+    ), {"table": table}).scalars().all()
+
+
+def ensure_archive_columns():
+    """Add the completed_at / sent_at columns the models map, if missing.
+
+    Runs on startup. The ALTER only happens the first time, so restarts
+    don't take a lock on the hot tables.
+    """
+    for table, (_, _, stamp, _) in ARCHIVE_SPECS.items():
+        if stamp not in table_columns(table):
+            db.session.execute(text(f"ALTER TABLE {table} ADD COLUMN IF NOT EXISTS {stamp} TIMESTAMPTZ"))
+    db.session.commit()
+
+
+def ensure_archive_schema():
+    """Create the archive tables and the indexes archiving relies on.
+
+    Run once per deploy via `flask archive-init`; indexes on the hot tables
+    are built CONCURRENTLY (outside a transaction) so traffic isn't blocked.
+    """
+    ensure_archive_columns()
+    for table in ARCHIVE_SPECS:
+        backfill_archive_timestamps(table)
+
+    indexes = [
+        "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_tasks_user_id ON tasks (user_id)",
+        "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_reminders_user_id ON reminders (user_id)",
+        "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_reminders_due ON reminders (remind_date) WHERE sent = FALSE",
+    ]
+    for table, (_, eligible, stamp, _) in ARCHIVE_SPECS.items():
+        indexes += [
+            f"DROP INDEX CONCURRENTLY IF EXISTS ix_{table}_{stamp}",
+            f"CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_{table}_archivable ON {table} ({stamp}) WHERE {eligible}",
+        ]
+    with db.engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        for stmt in indexes:
+            conn.execute(text(stmt))
+
+    for table, (pk, _, _, _) in ARCHIVE_SPECS.items():
+        db.session.execute(text(f"""CREATE TABLE IF NOT EXISTS {table}_archive (
+            LIKE {table} INCLUDING DEFAULTS,
+            archived_on DATE NOT NULL,
+            archived_at TIMESTAMPTZ NOT NULL DEFAULT CURRENT_TIMESTAMP,
+            PRIMARY KEY ({pk}, archived_on)
+        ) PARTITION BY RANGE (archived_on)"""))
+        db.session.execute(text(
+            f"CREATE TABLE IF NOT EXISTS {table}_archive_default PARTITION OF {table}_archive DEFAULT"
+        ))
+        db.session.execute(text(
+            f"CREATE INDEX IF NOT EXISTS ix_{table}_archive_user ON {table}_archive (user_id, archived_on, {pk})"
+        ))
+    db.session.commit()
+
+
+def backfill_archive_timestamps(table):
+    """Stamp eligible rows that predate (or bypassed) the timestamp column"""
+    _, eligible, stamp, backfill = ARCHIVE_SPECS[table]
+    db.session.execute(text(
+        f"UPDATE {table} SET {stamp} = {backfill} WHERE {eligible} AND {stamp} IS NULL"
+    ))
+    db.session.commit()
+
+
+def ensure_archive_partition(table, month_start, commit=True):
+    """Create the monthly partition of <table>_archive covering month_start.
+
+    With commit=False the partition is created inside the caller's
+    transaction (and not cached, since that transaction may roll back).
+    """
+    name = f"{table}_archive_p{month_start:%Y_%m}"
+    if name in _archive_partitions:
+        return
+    if db.session.execute(text("SELECT to_regclass(:name)"), {"name": name}).scalar():
+        _archive_partitions.add(name)
+        return
+    next_month = (month_start.replace(day=28) + timedelta(days=4)).replace(day=1)
+    db.session.execute(text(
+        f"CREATE TABLE IF NOT EXISTS {name} PARTITION OF {table}_archive "
+        f"FOR VALUES FROM ('{month_start.isoformat()}') TO ('{next_month.isoformat()}')"
+    ))
+    if commit:
+        db.session.commit()
+        _archive_partitions.add(name)
+
+
+def archive_table(table, cutoff, batch_size=ARCHIVE_BATCH_SIZE):
+    """Move eligible rows of one hot table into its archive, batch by batch"""
+    pk, eligible, stamp, _ = ARCHIVE_SPECS[table]
+    # Matches the partial index ix_<table>_archivable, so batches don't rescan the table
+    where = f"{eligible} AND {stamp} < :cutoff"
+    archived_on = datetime.now(timezone.utc).date()
+
+    backfill_archive_timestamps(table)
+    ensure_archive_partition(table, archived_on.replace(day=1))
+
+    columns = ", ".join(table_columns(table))
+    move = text(f"""
+        WITH batch AS (
+            SELECT {pk} FROM {table}
+            WHERE {where}
+            LIMIT :batch_size
+            FOR UPDATE SKIP LOCKED
+        ), moved AS (
+            DELETE FROM {table} h USING batch b
+            WHERE h.{pk} = b.{pk}
+            RETURNING h.*
+        )
+        INSERT INTO {table}_archive ({columns}, archived_on)
+        SELECT {columns}, :archived_on FROM moved
+    """)
+
+    total = 0
+    while True:
+        result = db.session.execute(move, {
+            "cutoff": cutoff,
+            "batch_size": batch_size,
+            "archived_on": archived_on
+        })
+        db.session.commit()
+        if result.rowcount <= 0:
+            break
+        total += result.rowcount
+    return total
+
+
+def archive_completed_items(days=None):
+    """Background job - archive completed tasks and sent reminders"""
+    with app.app_context():
+        days = ARCHIVE_AFTER_DAYS if days is None else days
+        cutoff = datetime.now(timezone.utc) - timedelta(days=days)
+        moved = {}
+        for table in ARCHIVE_SPECS:
+            try:
+                moved[table] = archive_table(table, cutoff)
+                print(f"🗄️ Archived {moved[table]} row(s) from {table} older than {cutoff:%Y-%m-%d}")
+            except Exception as e:
+                db.session.rollback()
+                print(f"❌ Error archiving {table}: {e}")
+        return moved
+
+
+def parse_archive_args():
+    """Read ?from=&to= (YYYY-MM-DD), ?limit= and ?cursor= for archive reads.
+
+    Without a range only the last ARCHIVE_READ_DAYS are read, so queries
+    are pruned to a few partitions.
+    """
+    start = request.args.get("from")
+    end = request.args.get("to")
+    end = datetime.strptime(end, "%Y-%m-%d").date() if end else datetime.now(timezone.utc).date()
+    start = datetime.strptime(start, "%Y-%m-%d").date() if start else end - timedelta(days=ARCHIVE_READ_DAYS)
+    limit = min(max(int(request.args.get("limit", ARCHIVE_READ_LIMIT)), 1), ARCHIVE_READ_MAX_LIMIT)
+
+    cursor = request.args.get("cursor")
+    if cursor:
+        cursor_date, cursor_id = cursor.split("_", 1)
+        cursor = (date.fromisoformat(cursor_date), str(uuid.UUID(cursor_id)))
+    return start, end, limit, cursor
+
+
+def fetch_archived(table, columns, start, end, limit, cursor):
+    """One page of the current user's archived rows, newest first.
+
+    Returns (rows, next cursor or None).
+    """
+    pk = ARCHIVE_SPECS[table][0]
+    query = (f"SELECT {', '.join(columns)}, archived_on FROM {table}_archive "
+             f"WHERE user_id = :user_id AND archived_on BETWEEN :start AND :end")
+    if cursor:
+        query += f" AND (archived_on, {pk}) < (:cursor_date, :cursor_id)"
+    query += f" ORDER BY archived_on DESC, {pk} DESC LIMIT :limit"
+    rows = db.session.execute(text(query), {
+        "user_id": current_user.user_id,
+        "start": start,
+        "end": end,
+        "cursor_date": cursor[0] if cursor else None,
+        "cursor_id": cursor[1] if cursor else None,
+        "limit": limit + 1
+    }).mappings().all()
+
+    if len(rows) <= limit:
+        return rows, None
+    last = rows[limit - 1]
+    return rows[:limit], f"{last['archived_on'].isoformat()}_{last[pk]}"
+
+
+@app.route("/getArchivedTasks")
+@login_required
+def get_archived_tasks():
+    try:
+        start, end, limit, cursor = parse_archive_args()
+    except ValueError:
+        return jsonify({"error": "Invalid from, to, limit or cursor"}), 400
+
+    tasks, next_cursor = fetch_archived(
+        "tasks", ["task_id", "task", "tags", "target_date", "note", "status"],
+        start, end, limit, cursor
+    )
+    return jsonify({
+        "items": [{
+            "id": str(t["task_id"]),
+            "text": t["task"],
+            "tags": t["tags"] or [],
+            "date": t["target_date"].isoformat() if t["target_date"] else None,
+            "note": t["note"],
+            "status": t["status"],
+            "archived_on": t["archived_on"].isoformat()
+        } for t in tasks],
+        "next": next_cursor
+    })
+
+
+@app.route("/getArchivedReminders")
+@login_required
+def get_archived_reminders():
+    try:
+        start, end, limit, cursor = parse_archive_args()
+    except ValueError:
+        return jsonify({"error": "Invalid from, to, limit or cursor"}), 400
+
+    reminders, next_cursor = fetch_archived(
+        "reminders", ["reminder_id", "reminder", "remind_date", "remind_time", "repeat_frequency"],
+        start, end, limit, cursor
+    )
+    return jsonify({
+        "items": [{
+            "id": str(r["reminder_id"]),
+            "text": r["reminder"],
+            "date": r["remind_date"].isoformat() if r["remind_date"] else None,
+            "time": r["remind_time"].isoformat() if r["remind_time"] else None,
+            "repeat": r["repeat_frequency"],
+            "archived_on": r["archived_on"].isoformat()
+        } for r in reminders],
+        "next": next_cursor
+    })
+
+
+@app.cli.command("archive")
+@click.option("--days", type=int, default=None, help="Archive items older than this many days")
+def archive_command(days):
+    """Archive completed tasks and sent reminders now"""
+    moved = archive_completed_items(days)
+    click.echo(", ".join(f"{table}: {count}" for table, count in moved.items()))
+
+
+@app.cli.command("archive-init")
+def archive_init_command():
+    """Create archive tables, timestamp columns and indexes (run on deploy)"""
+    ensure_archive_schema()
+    click.echo("Archive tables ready")
+
+
+# Add the timestamp columns the Task/Reminder models map before serving requests
+try:
+    with app.app_context():
+        ensure_archive_columns()
+except Exception as e:
+    print(f"❌ Archive column setup failed: {e}")
+
+# ============================================================================
+# BULK IMPORT / EXPORT (Postgres COPY)
+# ============================================================================
+# Account migrations and backups stream CSV or NDJSON straight through COPY
+# instead of one ORM insert per row. Columns come from the real tables (not
+# the models), so IDs, created_date and array columns (tags, completed_dates)
+# round-trip unchanged. In CSV files NULL is written as \N.
+
+# table -> (model supplying Python-side defaults, primary key)
+BULK_TABLES = {
+    "users": (User, "user_id"),
+    "tasks": (Task, "task_id"),
+    "tasks_archive": (Task, "task_id"),
+    "goals": (Goal, "goal_id"),
+    "reminders": (Reminder, "reminder_id"),
+    "reminders_archive": (Reminder, "reminder_id"),
+    "habits": (Habit, "habit_id"),
+}
+# Archive tables are CLI-only: their rows choose archived_on, which drives partitioning
+USER_OWNED_TABLES = ("tasks", "goals", "reminders", "habits")
+# Ignored in HTTP imports; the server stamps these itself
+SERVER_STAMPED_COLUMNS = ("completed_at", "sent_at", "archived_on", "archived_at")
+BULK_FORMATS = ("csv", "ndjson")
+IMPORT_CHUNK_SIZE = int(os.getenv("IMPORT_CHUNK_SIZE", "50000"))
+NULL_MARKER = "\\N"
+
+
+def parse_bool(value):
+    if isinstance(value, bool):
+        return value
+    lowered = str(value).strip().lower()
+    if lowered in ("t", "true", "1", "yes"):
+        return True
+    if lowered in ("f", "false", "0", "no"):
+        return False
+    raise ValueError(f"invalid boolean {value!r}")
+
+
+def parse_uuid(value):
+    return str(uuid.UUID(str(value)))
+
+
+# Postgres type name (information_schema udt_name) -> validator
+PG_PARSERS = {
+    "uuid": parse_uuid,
+    "date": lambda v: v if isinstance(v, date) else date.fromisoformat(v),
+    "time": lambda v: v if isinstance(v, time) else time.fromisoformat(v),
+    "timestamp": lambda v: v if isinstance(v, datetime) else datetime.fromisoformat(v),
+    "timestamptz": lambda v: v if isinstance(v, datetime) else datetime.fromisoformat(v),
+    "bool": parse_bool,
+    "int2": int,
+    "int4": int,
+    "int8": int,
+}
+
+
+def parse_pg_array(value):
+    """Split a Postgres array literal such as {a,"b c",NULL} into a list.
+
+    Only an unquoted NULL element becomes None; "NULL" in quotes is a string.
+    """
+    inner = value.strip()
+    if not (inner.startswith("{") and inner.endswith("}")):
+        raise ValueError(f"invalid array {value!r}")
+    inner = inner[1:-1]
+    if not inner.strip():
+        return []
+
+    items = []
+    buf, quoted, in_quotes, escaped = [], False, False, False
+
+    def finish():
+        item = "".join(buf)
+        if quoted:
+            return item
+        item = item.strip()
+        return None if item.upper() == "NULL" else item
+
+    for ch in inner:
+        if escaped:
+            buf.append(ch)
+            escaped = False
+        elif ch == "\\":
+            escaped = True
+        elif ch == '"':
+            in_quotes = not in_quotes
+            quoted = True
+        elif ch == "," and not in_quotes:
+            items.append(finish())
+            buf, quoted = [], False
+        else:
+            buf.append(ch)
+    if in_quotes or escaped:
+        raise ValueError(f"invalid array {value!r}")
+    items.append(finish())
+    return items
+
+
+def format_pg_array(values):
+    items = []
+    for v in values:
+        if v is None:
+            items.append("NULL")
+            continue
+        v = v.isoformat() if isinstance(v, (date, time)) else str(v)
+        items.append('"' + v.replace("\\", "\\\\").replace('"', '\\"') + '"')
+    return "{" + ",".join(items) + "}"
+
+
+def bulk_column_specs(table):
+    """Describe every column of the real table for validation and merging"""
+    model, _ = BULK_TABLES[table]
+    rows = db.session.execute(text(
+        "SELECT column_name, udt_name, is_nullable, column_default FROM information_schema.columns "
+        "WHERE table_schema = current_schema() AND table_name = :table "
+        "ORDER BY ordinal_position"
+    ), {"table": table}).mappings().all()
+    if not rows:
+        raise ValueError(f"table {table} does not exist")
+
+    specs = []
+    for row in rows:
+        udt = row["udt_name"]
+        if udt.startswith("_"):
+            item = PG_PARSERS.get(udt[1:], str)
+            def convert(v, item=item):
+                if isinstance(v, str):
+                    v = parse_pg_array(v)
+                if not isinstance(v, list):
+                    raise ValueError(f"expected a list, got {v!r}")
+                return [None if x is None else item(x) for x in v]
+        else:
+            convert = PG_PARSERS.get(udt, str)
+        model_column = model.__table__.columns.get(row["column_name"])
+        specs.append({
+            "name": row["column_name"],
+            "convert": convert,
+            "nullable": row["is_nullable"] == "YES",
+            "db_default": row["column_default"],
+            "default": model_column.default if model_column is not None else None,
+        })
+    return specs
+
+
+def validate_row(specs, raw, line_no):
+    """Validate one input row.
+
+    Returns its values in column order plus the names of columns missing
+    from the input. Defaults apply only to missing columns; an explicit
+    null stays null.
+    """
+    if None in raw:
+        raise ValueError(f"line {line_no}: too many fields")
+    unknown = set(raw) - {spec["name"] for spec in specs}
+    if unknown:
+        raise ValueError(f"line {line_no}: unknown column(s) {', '.join(sorted(map(str, unknown)))}")
+
+    values = []
+    missing = []
+    for spec in specs:
+        name = spec["name"]
+        value = raw.get(name)
+        if name not in raw:
+            default = spec["default"]
+            if default is not None:
+                value = default.arg(None) if default.is_callable else default.arg
+            elif spec["db_default"] is not None:
+                # Filled in with the database default during the merge
+                missing.append(name)
+                values.append(None)
+                continue
+        if value is None:
+            if not spec["nullable"]:
+                raise ValueError(f"line {line_no}: {name} is required")
+            values.append(None)
+            continue
+        try:
+            values.append(spec["convert"](value))
+        except (TypeError, ValueError) as e:
+            raise ValueError(f"line {line_no}: {name}: {e}")
+    return values, missing
+
+
+def format_copy_value(value):
+    if isinstance(value, bool):
+        return "t" if value else "f"
+    if isinstance(value, list):
+        return format_pg_array(value)
+    if isinstance(value, (date, time, datetime)):
+        return value.isoformat()
+    return str(value)
+
+
+def format_copy_row(values):
+    """One COPY CSV line: NULL is the bare marker, everything else is quoted"""
+    return ",".join(
+        NULL_MARKER if v is None else '"' + format_copy_value(v).replace('"', '""') + '"'
+        for v in values
+    ) + "\n"
+
+
+CSV_FIELD = re.compile(r'"((?:[^"]|"")*)"|([^,"\r\n]*)')
+
+
+def read_csv_records(stream):
+    """Yield (line number, fields) from CSV, telling quoted from bare values.
+
+    Unlike csv.reader this keeps a quoted NULL_MARKER as text; only the
+    bare marker (as COPY writes NULL) becomes None.
+    """
+    record = ""
+    line_no = 0
+    for line_no, line in enumerate(stream, start=1):
+        record += line
+        if record.count('"') % 2:
+            continue  # quoted field continues on the next line
+        record = record.rstrip("\r\n")
+        if record:
+            fields = []
+            pos = 0
+            while True:
+                match = CSV_FIELD.match(record, pos)
+                quoted, bare = match.group(1), match.group(2)
+                if quoted is not None:
+                    fields.append(quoted.replace('""', '"'))
+                else:
+                    fields.append(None if bare == NULL_MARKER else bare)
+                pos = match.end()
+                if pos == len(record):
+                    break
+                if record[pos] != ",":
+                    raise csv.Error(f"line {line_no}: malformed CSV field")
+                pos += 1
+            yield line_no, fields
+        record = ""
+    if record:
+        raise csv.Error(f"line {line_no}: unterminated quoted field")
+
+
+def read_bulk_rows(stream, fmt):
+    """Yield (line number, dict of raw values) from a CSV or NDJSON stream"""
+    if fmt == "csv":
+        records = read_csv_records(stream)
+        header = next(records, (0, []))[1]
+        for line_no, fields in records:
+            row = dict(zip(header, fields))
+            if len(fields) > len(header):
+                row[None] = fields[len(header):]
+            yield line_no, row
+    else:
+        for line_no, line in enumerate(stream, start=1):
+            if line.strip():
+                try:
+                    yield line_no, json.loads(line)
+                except json.JSONDecodeError as e:
+                    raise ValueError(f"line {line_no}: invalid JSON: {e}")
+
+
+def bulk_conflict_tables(table):
+    """Tables whose IDs an import into `table` must not duplicate"""
+    if table.endswith("_archive"):
+        return [table, table[:-len("_archive")]]
+    if table in ARCHIVE_SPECS:
+        return [f"{table}_archive"]
+    return []
+
+
+def bulk_import(table, stream, fmt, user_id=None, drop_columns=(), chunk_size=IMPORT_CHUNK_SIZE):
+    """Validate rows in chunks, COPY them into a staging table, then merge.
+
+    Rows whose primary key (or a unique column) already exists, in the table
+    or in its archive counterpart, are skipped. When user_id is given every
+    row is assigned to that user; drop_columns are ignored in the input and
+    left for the server to fill. The whole import is one transaction, so
+    any error leaves nothing behind and is raised as ValueError.
+    Returns (rows read, rows inserted).
+    """
+    _, pk = BULK_TABLES[table]
+    cursor = db.session.connection().connection.cursor()
+    try:
+        specs = bulk_column_specs(table)
+        names = ", ".join(spec["name"] for spec in specs)
+        user_idx = next((i for i, spec in enumerate(specs) if spec["name"] == "user_id"), None)
+
+        stage = f"{table}_import"
+        cursor.execute(
+            f"CREATE TEMP TABLE {stage} ON COMMIT DROP AS "
+            f"SELECT {names}, NULL::text[] AS _missing FROM {table} WITH NO DATA"
+        )
+        copy_sql = f"COPY {stage} ({names}, _missing) FROM STDIN WITH (FORMAT csv, NULL '{NULL_MARKER}')"
+
+        total = 0
+        buf = io.StringIO()
+        pending = 0
+        for line_no, raw in read_bulk_rows(stream, fmt):
+            if not isinstance(raw, dict):
+                raise ValueError(f"line {line_no}: expected an object")
+            for name in drop_columns:
+                raw.pop(name, None)
+            values, missing = validate_row(specs, raw, line_no)
+            if user_id is not None and user_idx is not None:
+                values[user_idx] = user_id
+            buf.write(format_copy_row(values + [missing or None]))
+            pending += 1
+            if pending >= chunk_size:
+                buf.seek(0)
+                cursor.copy_expert(copy_sql, buf)
+                total += pending
+                pending = 0
+                buf.seek(0)
+                buf.truncate()
+        if pending:
+            buf.seek(0)
+            cursor.copy_expert(copy_sql, buf)
+            total += pending
+
+        if table.endswith("_archive"):
+            # Past months land in the DEFAULT partition; only the current
+            # month's partition may be created, so input can't trigger more DDL
+            cursor.execute(f"SELECT 1 FROM {stage} WHERE archived_on > CURRENT_DATE LIMIT 1")
+            if cursor.fetchone():
+                raise ValueError("archived_on cannot be in the future")
+            month_start = datetime.now(timezone.utc).date().replace(day=1)
+            ensure_archive_partition(table[:-len("_archive")], month_start, commit=False)
+
+        select = ", ".join(
+            f"CASE WHEN '{spec['name']}' = ANY(s._missing) THEN {spec['db_default']} "
+            f"ELSE s.{spec['name']} END AS {spec['name']}" if spec["db_default"]
+            else f"s.{spec['name']}"
+            for spec in specs
+        )
+        where = " AND ".join(
+            f"NOT EXISTS (SELECT 1 FROM {other} o WHERE o.{pk} = s.{pk})"
+            for other in bulk_conflict_tables(table)
+        )
+        cursor.execute(
+            f"INSERT INTO {table} ({names}) "
+            f"SELECT DISTINCT ON (s.{pk}) {select} FROM {stage} s "
+            + (f"WHERE {where} " if where else "")
+            + "ON CONFLICT DO NOTHING"
+        )
+        inserted = cursor.rowcount
+        db.session.commit()
+        return total, inserted
+    except (csv.Error, psycopg2.Error, SQLAlchemyError) as e:
+        db.session.rollback()
+        raise ValueError(str(e).strip()) from e
+    except Exception:
+        db.session.rollback()
+        raise
+    finally:
+        cursor.close()
+
+
+def bulk_export(table, out, fmt, user_id=None):
+    """COPY a table (optionally one user's rows) to a binary file object.
+
+    Database errors are raised as ValueError.
+    """
+    cursor = db.session.connection().connection.cursor()
+    try:
+        columns = table_columns(table)
+        if not columns:
+            raise ValueError(f"table {table} does not exist")
+        select = f"SELECT {', '.join(columns)} FROM {table}"
+        if user_id is not None:
+            select += cursor.mogrify(" WHERE user_id = %s", (user_id,)).decode()
+        if fmt == "csv":
+            sql = f"COPY ({select}) TO STDOUT WITH (FORMAT csv, HEADER, NULL '{NULL_MARKER}')"
+        else:
+            # CSV mode with control-character quote/delimiter emits the JSON verbatim
+            sql = (f"COPY (SELECT row_to_json(r) FROM ({select}) r) TO STDOUT "
+                   f"WITH (FORMAT csv, QUOTE E'\\x01', DELIMITER E'\\x02')")
+        cursor.copy_expert(sql, out)
+    except (psycopg2.Error, SQLAlchemyError) as e:
+        raise ValueError(str(e).strip()) from e
+    finally:
+        cursor.close()
+        db.session.rollback()
+
+
+@app.route("/export/<table>")
+@login_required
+def export_data(table):
+    fmt = request.args.get("format", "ndjson")
+    if table not in USER_OWNED_TABLES or fmt not in BULK_FORMATS:
+        return jsonify({"error": "Not found"}), 404
+
+    out = tempfile.SpooledTemporaryFile(max_size=8 * 1024 * 1024)
+    try:
+        bulk_export(table, out, fmt, user_id=current_user.user_id)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    out.seek(0)
+    return send_file(
+        out,
+        mimetype="text/csv" if fmt == "csv" else "application/x-ndjson",
+        as_attachment=True,
+        download_name=f"{table}.{fmt}"
+    )
+
+
+@app.route("/import/<table>", methods=["POST"])
+@login_required
+def import_data(table):
+    fmt = request.args.get("format", "ndjson")
+    if table not in USER_OWNED_TABLES or fmt not in BULK_FORMATS:
+        return jsonify({"error": "Not found"}), 404
+
+    stream = io.TextIOWrapper(request.stream, encoding="utf-8", newline="")
+    try:
+        total, inserted = bulk_import(
+            table, stream, fmt,
+            user_id=current_user.user_id,
+            drop_columns=SERVER_STAMPED_COLUMNS
+        )
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    return jsonify({"success": True, "received": total, "inserted": inserted}), 201
+
+
+@app.cli.command("export")
+@click.argument("table", type=click.Choice(list(BULK_TABLES)))
+@click.argument("output", type=click.File("wb"), default="-")
+@click.option("--format", "fmt", type=click.Choice(BULK_FORMATS), default="ndjson")
+@click.option("--user-id", default=None, help="Only export rows owned by this user")
+def export_command(table, output, fmt, user_id):
+    """Export a table to CSV or NDJSON"""
+    try:
+        bulk_export(table, output, fmt, user_id=user_id)
+    except (ValueError, psycopg2.Error) as e:
+        raise click.ClickException(str(e).strip())
+
+
+@app.cli.command("import")
+@click.argument("table", type=click.Choice(list(BULK_TABLES)))
+@click.argument("source", type=click.File("r", encoding="utf-8"), default="-")
+@click.option("--format", "fmt", type=click.Choice(BULK_FORMATS), default="ndjson")
+@click.option("--chunk-size", type=int, default=IMPORT_CHUNK_SIZE, help="Rows validated per COPY batch")
+def import_command(table, source, fmt, chunk_size):
+    """Import a CSV or NDJSON file, keeping IDs"""
+    try:
+        total, inserted = bulk_import(table, source, fmt, chunk_size=chunk_size)
+    except ValueError as e:
+        raise click.ClickException(str(e))
+    click.echo(f"{table}: read {total}, inserted {inserted}, skipped {total - inserted}")
+
 # ============================================================================
 # SCHEDULER SETUP
 # ============================================================================
@@ -680,6 +1448,15 @@ scheduler.add_job(
     replace_existing=True
 )
 
+scheduler.add_job(
+    func=archive_completed_items,
+    trigger="cron",
+    hour=3,
+    id='archiver',
+    name='Archive completed tasks and sent reminders daily',
+    replace_existing=True
+)
+
 scheduler.start()
 print("✅ APScheduler started - checking reminders every 10 seconds")
 